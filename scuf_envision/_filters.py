@@ -0,0 +1,30 @@
+"""
+Scalar stick kernel, compiled with numba when it is installed.
+
+numba is optional: without it the same function runs as plain Python, so the
+filter output is identical either way.
+"""
+
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+
+# No fastmath: reassociating the divide would shift full deflection off STICK_MAX.
+@njit(cache=True)
+def _filter_stick(x, y, dz, dz_sq, dz_range):
+    """
+    Radial deadzone for one stick sample.
+
+    Returns (magnitude, scale) where scale is the linear [0, 1] position between
+    the deadzone edge and full deflection; (0.0, 0.0) inside the deadzone.
+    """
+    mag_sq = x * x + y * y
+    if mag_sq < dz_sq or mag_sq == 0:
+        return 0.0, 0.0
+    magnitude = math.sqrt(mag_sq)
+    return magnitude, min((magnitude - dz) / dz_range, 1.0)
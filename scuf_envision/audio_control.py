@@ -8,7 +8,6 @@ see it). Rebinding restores it.
 Requires root (writes to /sys/bus/usb/drivers/snd-usb-audio/{unbind,bind}).
 """
 
-import glob
 import logging
 import os
 import subprocess
@@ -21,80 +20,106 @@ from .constants import SCUF_VENDOR_ID, SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RE
 log = logging.getLogger(__name__)
 
 SND_USB_AUDIO_DRIVER = "/sys/bus/usb/drivers/snd-usb-audio"
+USB_DEVICES_DIR = "/sys/bus/usb/devices"
 
+# Last audio.disabled value applied by apply_audio_config (None until first call).
+_last_applied = None
 
-def _read_sysfs(path):
-    """Read a sysfs attribute, return empty string on failure."""
+_SCUF_VID = f"{SCUF_VENDOR_ID:04x}".encode()
+_SCUF_PIDS = frozenset(f"{pid:04x}".encode()
+                       for pid in (SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RECEIVER))
+
+
+def _read_sysfs_id(path):
+    """Read a short sysfs attribute (IDs, class codes) as bytes, return b"" on failure."""
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return b""
     try:
-        return Path(path).read_text().strip()
-    except (OSError, IOError):
-        return ""
+        return os.read(fd, 16).strip()
+    except OSError:
+        return b""
+    finally:
+        os.close(fd)
 
 
 def _match_scuf_vid_pid(sysfs_dir):
-    """Walk up from sysfs_dir to find idVendor/idProduct and check for SCUF match."""
-    target_vid = f"{SCUF_VENDOR_ID:04x}"
-    target_pids = {f"{SCUF_PRODUCT_ID_WIRED:04x}", f"{SCUF_PRODUCT_ID_RECEIVER:04x}"}
-
-    check = sysfs_dir
-    for _ in range(10):
-        check = os.path.dirname(check)
-        if not check or check == "/":
-            break
-        vid_path = os.path.join(check, "idVendor")
-        pid_path = os.path.join(check, "idProduct")
-        if os.path.isfile(vid_path) and os.path.isfile(pid_path):
-            vid = _read_sysfs(vid_path)
-            pid = _read_sysfs(pid_path)
-            return vid == target_vid and pid in target_pids
-    return False
+    """Check whether the USB device owning interface sysfs_dir is a SCUF."""
+    # Interface realpaths end in ".../usbN/N-M/N-M:C.I"; the parent is the
+    # USB device node holding idVendor/idProduct, so no upward walk is needed.
+    parent = sysfs_dir.rsplit("/", 1)[0]
+    return (_read_sysfs_id(f"{parent}/idVendor") == _SCUF_VID
+            and _read_sysfs_id(f"{parent}/idProduct") in _SCUF_PIDS)
 
 
-def _find_scuf_audio_interfaces(bound_only=True):
+def _scan_scuf_audio():
     """
-    Find USB interface identifiers for SCUF audio devices.
-
-    Args:
-        bound_only: If True, only return interfaces currently bound to
-                    snd-usb-audio. If False, scan all USB interfaces for
-                    SCUF audio-class devices (bound or not).
+    Find all SCUF USB audio-class interfaces in a single sysfs pass.
 
     Returns:
-        List of interface identifiers (e.g. "3-2:1.0") suitable for
-        writing to unbind/bind.
+        List of (interface_id, is_bound) tuples, where interface_id (e.g.
+        "3-2:1.0") is suitable for writing to unbind/bind and is_bound is
+        True if the interface is currently bound to snd-usb-audio.
     """
+    try:
+        with os.scandir(USB_DEVICES_DIR) as it:
+            entries = [entry for entry in it if ":" in entry.name]
+    except OSError as e:
+        log.debug("Cannot scan %s: %s", USB_DEVICES_DIR, e)
+        return []
+
     results = []
+    for entry in entries:
+        # Anything snd-usb-audio has bound counts regardless of class; otherwise
+        # only USB Audio class (01) interfaces are candidates for binding.
+        bound = os.path.lexists(os.path.join(SND_USB_AUDIO_DRIVER, entry.name))
+        if not bound:
+            intf_class = _read_sysfs_id(os.path.join(entry.path, "bInterfaceClass"))
+            if intf_class != b"01":
+                if not intf_class:
+                    log.debug("Skipping %s: cannot read bInterfaceClass", entry.name)
+                continue
+        try:
+            link = os.readlink(entry.path)
+        except OSError as e:
+            log.debug("Skipping %s: %s", entry.name, e)
+            continue
+        # sysfs links are relative to the bus dir; the kernel resolves the
+        # ".." hops, so no realpath canonicalization is needed.
+        if _match_scuf_vid_pid(os.path.join(USB_DEVICES_DIR, link)):
+            results.append((entry.name, bound))
+            log.debug("Found SCUF USB audio interface: %s (bound=%s)", entry.name, bound)
+    return results
 
-    if bound_only:
-        if not os.path.isdir(SND_USB_AUDIO_DRIVER):
-            log.debug("snd-usb-audio driver directory not found")
-            return []
 
-        for entry in os.listdir(SND_USB_AUDIO_DRIVER):
-            entry_path = os.path.join(SND_USB_AUDIO_DRIVER, entry)
-            if not os.path.islink(entry_path):
-                continue
-            real = os.path.realpath(entry_path)
-            if _match_scuf_vid_pid(real):
-                results.append(entry)
-                log.debug("Found bound SCUF audio interface: %s", entry)
-    else:
-        # Scan all USB interfaces for bInterfaceClass=01 (USB Audio)
-        for intf_dir in glob.glob("/sys/bus/usb/devices/*:*"):
-            intf_class = _read_sysfs(os.path.join(intf_dir, "bInterfaceClass"))
-            if intf_class != "01":
-                continue
-            parent = os.path.dirname(intf_dir)
-            target_vid = f"{SCUF_VENDOR_ID:04x}"
-            target_pids = {f"{SCUF_PRODUCT_ID_WIRED:04x}", f"{SCUF_PRODUCT_ID_RECEIVER:04x}"}
-            vid = _read_sysfs(os.path.join(parent, "idVendor"))
-            pid = _read_sysfs(os.path.join(parent, "idProduct"))
-            if vid == target_vid and pid in target_pids:
-                intf_id = os.path.basename(intf_dir)
-                results.append(intf_id)
-                log.debug("Found SCUF USB audio interface: %s", intf_id)
+def _find_scuf_audio_interfaces(bound_only=True):
+    """Return SCUF audio interface ids, optionally only those bound to snd-usb-audio."""
+    return [intf_id for intf_id, bound in _scan_scuf_audio() if bound or not bound_only]
 
-    return results
+
+def _write_each(attr, interfaces):
+    """Write each interface id to snd-usb-audio's attr file; return how many succeeded."""
+    path = os.path.join(SND_USB_AUDIO_DRIVER, attr)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC)
+    except OSError as e:
+        log.error("Cannot open %s: %s", path, e)
+        return 0
+    # One fd for the batch: sysfs treats each write() as a discrete command, and raw
+    # os.write of pre-encoded ids skips the text-IO layer entirely.
+    count = 0
+    try:
+        for intf_id in interfaces:
+            try:
+                os.write(fd, intf_id.encode("ascii"))
+                log.info("Wrote SCUF audio interface %s to snd-usb-audio/%s", intf_id, attr)
+                count += 1
+            except OSError as e:
+                log.error("Failed to write %s to snd-usb-audio/%s: %s", intf_id, attr, e)
+    finally:
+        os.close(fd)
+    return count
 
 
 def unbind_scuf_audio():
@@ -103,23 +128,22 @@ def unbind_scuf_audio():
 
     Returns the number of interfaces unbound.
     """
-    interfaces = _find_scuf_audio_interfaces(bound_only=True)
+    # Cheap pre-check: the driver dir only holds control files (bind, unbind, uevent,
+    # ...) unless some interface ("N-M:C.I") is bound, which is the usual steady state
+    # once audio is disabled — skip the full USB scan then.
+    try:
+        with os.scandir(SND_USB_AUDIO_DRIVER) as it:
+            any_bound = any(":" in entry.name for entry in it)
+    except FileNotFoundError:
+        log.debug("snd-usb-audio driver not loaded")
+        return 0
+
+    interfaces = _find_scuf_audio_interfaces(bound_only=True) if any_bound else []
     if not interfaces:
         log.info("No SCUF audio interfaces currently bound to snd-usb-audio")
         return 0
 
-    unbind_path = os.path.join(SND_USB_AUDIO_DRIVER, "unbind")
-    count = 0
-    for intf_id in interfaces:
-        try:
-            with open(unbind_path, "w") as f:
-                f.write(intf_id)
-            log.info("Unbound SCUF audio interface: %s", intf_id)
-            count += 1
-        except OSError as e:
-            log.error("Failed to unbind %s: %s", intf_id, e)
-
-    return count
+    return _write_each("unbind", interfaces)
 
 
 def rebind_scuf_audio():
@@ -131,26 +155,13 @@ def rebind_scuf_audio():
 
     Returns the number of interfaces rebound.
     """
-    all_interfaces = _find_scuf_audio_interfaces(bound_only=False)
-    bound_interfaces = set(_find_scuf_audio_interfaces(bound_only=True))
-    unbound = [i for i in all_interfaces if i not in bound_interfaces]
+    unbound = [intf_id for intf_id, bound in _scan_scuf_audio() if not bound]
 
     if not unbound:
         log.info("All SCUF audio interfaces already bound (or device not connected)")
         return 0
 
-    bind_path = os.path.join(SND_USB_AUDIO_DRIVER, "bind")
-    count = 0
-    for intf_id in unbound:
-        try:
-            with open(bind_path, "w") as f:
-                f.write(intf_id)
-            log.info("Rebound SCUF audio interface: %s", intf_id)
-            count += 1
-        except OSError as e:
-            log.error("Failed to rebind %s: %s", intf_id, e)
-
-    return count
+    return _write_each("bind", unbound)
 
 
 def restart_pipewire_services():
@@ -199,11 +210,16 @@ def apply_audio_config():
     """
     Read config and apply the audio disabled/enabled state.
 
-    Called at driver startup and on wireless reconnect.
+    Called at driver startup and on wireless reconnect. The disabled state is
+    always re-checked (a re-enumerated device comes back bound), but once audio
+    has been enabled in this process, a reconnect with nothing to rebind skips
+    the settle delay and WirePlumber restart.
     """
+    global _last_applied
     from .config import is_audio_disabled
 
-    if is_audio_disabled():
+    disabled = is_audio_disabled()
+    if disabled:
         n = unbind_scuf_audio()
         if n > 0:
             log.info("Audio disabled: unbound %d SCUF audio interface(s)", n)
@@ -213,5 +229,8 @@ def apply_audio_config():
         n = rebind_scuf_audio()
         if n > 0:
             log.info("Audio enabled: rebound %d SCUF audio interface(s)", n)
+        elif _last_applied is False:
+            return
         time.sleep(1)  # let kernel driver settle before WirePlumber rescans
         restart_pipewire_services()
+    _last_applied = disabled
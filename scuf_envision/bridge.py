@@ -28,17 +28,48 @@ from .discovery import DiscoveredDevice, discover_scuf, find_competing_gamepads
 from .input_filter import InputFilter
 from .ipc import IPCServer
 from .profile import ProfileManager
-from .virtual_gamepad import VirtualGamepad
+from .virtual_gamepad import VirtualGamepad, _EVENT_SIZE
 
 log = logging.getLogger(__name__)
 
 _MACRO_TAP_MS = 30.0
 
+# ecodes lookups hoisted to module ints for the per-packet input path.
+_EV_KEY = ecodes.EV_KEY
+_EV_ABS = ecodes.EV_ABS
+_ABS_X = ecodes.ABS_X
+_ABS_Y = ecodes.ABS_Y
+_ABS_RX = ecodes.ABS_RX
+_ABS_RY = ecodes.ABS_RY
+_ABS_Z = ecodes.ABS_Z
+_ABS_RZ = ecodes.ABS_RZ
+
+# Up to 64 struct input_event records per read; whole events whatever the ABI's timeval size.
+_DRAIN_BYTES = _EVENT_SIZE * 64
+
+
+def _drain(fd: int) -> None:
+    """Discard pending evdev events without building InputEvent objects.
+
+    Raises OSError (e.g. ENODEV) if the device has gone away.
+    """
+    try:
+        os.read(fd, _DRAIN_BYTES)
+    except BlockingIOError:
+        pass
+
 
 class _DeviceDisconnected(Exception):
     pass
 
 
+class _Frame(threading.local):
+    """Per-thread event accumulator: ControlReader and AnalogListener each sync their own packets."""
+
+    def __init__(self):
+        self.events: list[tuple[int, int, int]] = []
+
+
 class BridgeService:
     """Bridges the physical SCUF controller to a virtual Xbox gamepad."""
 
@@ -67,6 +98,8 @@ class BridgeService:
         self._physical = None
         self._grabbed_devices = []
         self._running = False
+        self._wake_r = self._wake_w = -1
+        self._poll_timeout: float = 0.002
         self._profile: ProfileManager | None = None
         self._ipc: IPCServer | None = ipc_server
         self._macro_cancel: dict[int, threading.Event] = {}
@@ -75,6 +108,17 @@ class BridgeService:
         self._raw_left_y = 0
         self._raw_right_x = 0
         self._raw_right_y = 0
+        # Events emitted since the last SYN_REPORT, per HID reader thread; _syn flushes
+        # them as one uinput write and skips empty frames entirely.
+        self._frame = _Frame()
+        self._axis_handlers = {
+            _ABS_X: self._on_left_x,
+            _ABS_Y: self._on_left_y,
+            _ABS_RX: self._on_right_x,
+            _ABS_RY: self._on_right_y,
+            _ABS_Z: self._on_left_trigger,
+            _ABS_RZ: self._on_right_trigger,
+        }
 
     def start(self):
         """Open devices and start the event loop."""
@@ -82,6 +126,7 @@ class BridgeService:
         signal.signal(signal.SIGTERM, self._signal_handler)
 
         self._running = True
+        self._wake_r, self._wake_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
         try:
             self.gamepad.create(rumble=self._rumble_enabled)
 
@@ -107,7 +152,7 @@ class BridgeService:
             if self.discovered.hidraw_path:
                 from .hid import AnalogListener
                 self._analog = AnalogListener(self.discovered.hidraw_path,
-                                              self._on_hid_axis, self.gamepad.syn)
+                                              self._on_hid_axis, self._syn)
                 try:
                     self._analog.start()
                 except OSError as e:
@@ -130,7 +175,7 @@ class BridgeService:
             # set_input_callbacks() clears _btn_state on registration.
             if self._control:
                 self._control.set_input_callbacks(
-                    self._on_hid_button, self._on_hid_axis, self.gamepad.syn)
+                    self._on_hid_button, self._on_hid_axis, self._syn)
 
             # Load profiles from config
             config = load_config()
@@ -146,6 +191,7 @@ class BridgeService:
             self._activity_tracking = rgb_activity_tracking()
             self._idle_after = rgb_idle_after()
             self._sleep_after = rgb_sleep_after()
+            self._poll_timeout = _poll_timeout_ms() / 1000.0
             self._last_input_time = time.monotonic()
 
             self._reload_input_config()
@@ -211,66 +257,85 @@ class BridgeService:
                 log.warning("Could not suppress competing gamepad %s: %s", path, e)
 
     def _event_loop(self):
-        """Main event loop — interrupt-driven via select, effectively 500 Hz.
+        """Main event loop — blocks in epoll until a watched fd is ready.
 
         All input (buttons, axes, triggers) arrives via HID raw callbacks (_on_hid_button,
         _on_hid_axis) from ControlReader and AnalogListener threads. The physical evdev fd
         is held grabbed here only to detect disconnect and suppress double-input to other
-        processes — evdev events are drained without being processed.
+        processes — evdev events are drained without being processed. Shutdown wakes the
+        loop through the self-pipe written by _signal_handler.
         """
         phys_fd = self._physical.fd
-        poll = select.poll()
-        poll.register(phys_fd, select.POLLIN)
-        timeout = _poll_timeout_ms()
+        # Level-triggered: _drain and IPCServer.handle_request consume one batch/connection
+        # per wakeup, so edge-triggered mode could strand remaining data.
+        ep = select.epoll()
+        ep.register(phys_fd, select.EPOLLIN)
+        ep.register(self._wake_r, select.EPOLLIN)
 
         vgpad_fd = self.gamepad.fd if self._rumble else -1
         if vgpad_fd >= 0:
-            poll.register(vgpad_fd, select.POLLIN)
+            ep.register(vgpad_fd, select.EPOLLIN)
 
         ipc_fd = self._ipc.fileno() if self._ipc else -1
         if ipc_fd >= 0:
-            poll.register(ipc_fd, select.POLLIN)
+            ep.register(ipc_fd, select.EPOLLIN)
 
         secondary_fd_map = {dev.fd: dev for dev in self._grabbed_devices
                             if dev is not self._physical}
         for sec_fd in secondary_fd_map:
-            poll.register(sec_fd, select.POLLIN)
+            ep.register(sec_fd, select.EPOLLIN)
 
-        while self._running:
-            events = poll.poll(timeout)
-            self._check_rgb_activity()
-            if not events:
-                continue
+        try:
+            while self._running:
+                events = ep.poll(self._loop_timeout())
+                self._check_rgb_activity()
+                self._dispatch_ready(events, phys_fd, vgpad_fd, ipc_fd, secondary_fd_map)
+        finally:
+            ep.close()
 
-            for ready_fd, _ in events:
-                if ready_fd == phys_fd:
-                    try:
-                        for _ in self._physical.read():
-                            pass  # drain; all input arrives via HID raw callbacks
-                    except OSError as e:
-                        if self._running:
-                            log.error("Device read error: %s", e)
-                            raise _DeviceDisconnected() from e
-                elif ready_fd in secondary_fd_map:
-                    try:
-                        for _ in secondary_fd_map[ready_fd].read():
-                            pass  # drain secondary devices
-                    except OSError as e:
-                        if self._running:
-                            log.error("Secondary device read error: %s", e)
-                            raise _DeviceDisconnected() from e
-                elif ready_fd == vgpad_fd:
-                    self._handle_ff_events()
-                elif ready_fd == ipc_fd:
-                    self._ipc.handle_request(
-                        self._profile, self._build_status_state(),
-                        extras={
-                            "set_rgb": self._set_rgb_mode,
-                            "on_profile_switch": self._on_profile_switch,
-                            "on_layer_switch": self._on_layer_switch,
-                            "on_reload": self._on_reload,
-                        }
-                    )
+    def _loop_timeout(self) -> float:
+        """epoll timeout in seconds: -1 (block) unless RGB activity tracking needs a tick.
+
+        While active, sleep until the idle deadline; once idle/asleep, wake every
+        [driver] poll_timeout_ms so the first input restores the active state promptly.
+        """
+        if not self._activity_tracking or self._rgb is None:
+            return -1
+        if self._rgb_activity_state == 'active':
+            return max(0.0, self._last_input_time + self._idle_after - time.monotonic())
+        return self._poll_timeout
+
+    def _dispatch_ready(self, events, phys_fd: int, vgpad_fd: int, ipc_fd: int,
+                        secondary_fd_map: dict) -> None:
+        for ready_fd, _ in events:
+            if ready_fd == self._wake_r:
+                os.read(self._wake_r, 64)  # loop re-checks self._running
+            elif ready_fd == phys_fd:
+                try:
+                    _drain(phys_fd)  # all input arrives via HID raw callbacks
+                except OSError as e:
+                    if self._running:
+                        log.error("Device read error: %s", e)
+                        raise _DeviceDisconnected() from e
+            elif ready_fd in secondary_fd_map:
+                try:
+                    _drain(ready_fd)
+                except OSError as e:
+                    if self._running:
+                        log.error("Secondary device read error: %s", e)
+                        raise _DeviceDisconnected() from e
+            elif ready_fd == vgpad_fd:
+                self._handle_ff_events()
+            elif ready_fd == ipc_fd:
+                self._ipc.handle_request(
+                    self._profile, self._build_status_state(),
+                    extras={
+                        "set_rgb": self._set_rgb_mode,
+                        "on_profile_switch": self._on_profile_switch,
+                        "on_layer_switch": self._on_layer_switch,
+                        "on_reload": self._on_reload,
+                    }
+                )
 
     def _on_hid_button(self, code: int, value: int) -> None:
         self._last_input_time = time.monotonic()
@@ -288,10 +353,10 @@ class BridgeService:
                 if value:
                     self._run_macro(code, macro)
                 return  # consume both press and release
-            out = self._profile.effective_button_map.get(code, code)
+            out = self._profile.effective_button_lut[code]
         else:
             out = code
-        self.gamepad.emit_button(out, value)
+        self._frame.events.append((_EV_KEY, out, value))
 
     def _run_macro(self, trigger_code: int, macro) -> None:
         """Fire a macro in a daemon thread; cancel any in-flight macro for the same trigger."""
@@ -304,12 +369,10 @@ class BridgeService:
             for step in macro.steps:
                 if cancel.is_set():
                     break
-                self.gamepad.emit_button(step.code, 1)
-                self.gamepad.syn()
+                self.gamepad.emit_frame([(_EV_KEY, step.code, 1)])
                 hold = (step.hold_ms or _MACRO_TAP_MS) / 1000.0
                 cancelled = cancel.wait(hold)
-                self.gamepad.emit_button(step.code, 0)
-                self.gamepad.syn()
+                self.gamepad.emit_frame([(_EV_KEY, step.code, 0)])
                 if cancelled:
                     break
 
@@ -318,35 +381,38 @@ class BridgeService:
 
     def _on_hid_axis(self, code: int, value: int) -> None:
         self._last_input_time = time.monotonic()
-        if code == ecodes.ABS_X:
-            self._raw_left_x = value
-            self._emit_filtered_stick("left", self._raw_left_x, self._raw_left_y,
-                                      ecodes.ABS_X, ecodes.ABS_Y)
-        elif code == ecodes.ABS_Y:
-            self._raw_left_y = value
-            self._emit_filtered_stick("left", self._raw_left_x, self._raw_left_y,
-                                      ecodes.ABS_X, ecodes.ABS_Y)
-        elif code == ecodes.ABS_RX:
-            self._raw_right_x = value
-            self._emit_filtered_stick("right", self._raw_right_x, self._raw_right_y,
-                                      ecodes.ABS_RX, ecodes.ABS_RY)
-        elif code == ecodes.ABS_RY:
-            self._raw_right_y = value
-            self._emit_filtered_stick("right", self._raw_right_x, self._raw_right_y,
-                                      ecodes.ABS_RX, ecodes.ABS_RY)
-        elif code == ecodes.ABS_Z:
-            filtered = self.filter.filter_trigger(value, side='left')
-            filtered, changed = self.filter.suppress_jitter("lt", filtered)
-            if changed:
-                self.gamepad.emit_axis(ecodes.ABS_Z, filtered)
-        elif code == ecodes.ABS_RZ:
-            filtered = self.filter.filter_trigger(value, side='right')
-            filtered, changed = self.filter.suppress_jitter("rt", filtered)
-            if changed:
-                self.gamepad.emit_axis(ecodes.ABS_RZ, filtered)
+        handler = self._axis_handlers.get(code)
+        if handler:
+            handler(value)
         else:
             # HAT0X/HAT0Y from HID DPAD bitmask — emit raw (integers, no filtering needed)
-            self.gamepad.emit_axis(code, value)
+            self._frame.events.append((_EV_ABS, code, value))
+
+    def _on_left_x(self, value: int) -> None:
+        self._raw_left_x = value
+        self._emit_filtered_stick("left", value, self._raw_left_y, _ABS_X, _ABS_Y)
+
+    def _on_left_y(self, value: int) -> None:
+        self._raw_left_y = value
+        self._emit_filtered_stick("left", self._raw_left_x, value, _ABS_X, _ABS_Y)
+
+    def _on_right_x(self, value: int) -> None:
+        self._raw_right_x = value
+        self._emit_filtered_stick("right", value, self._raw_right_y, _ABS_RX, _ABS_RY)
+
+    def _on_right_y(self, value: int) -> None:
+        self._raw_right_y = value
+        self._emit_filtered_stick("right", self._raw_right_x, value, _ABS_RX, _ABS_RY)
+
+    def _on_left_trigger(self, value: int) -> None:
+        filtered, changed = self.filter.process_trigger(value, 'left', _ABS_Z)
+        if changed:
+            self._frame.events.append((_EV_ABS, _ABS_Z, filtered))
+
+    def _on_right_trigger(self, value: int) -> None:
+        filtered, changed = self.filter.process_trigger(value, 'right', _ABS_RZ)
+        if changed:
+            self._frame.events.append((_EV_ABS, _ABS_RZ, filtered))
 
     def _handle_ff_events(self):
         ui = self.gamepad.uinput
@@ -395,13 +461,17 @@ class BridgeService:
             log.debug("FF read error (non-fatal): %s", e)
 
     def _emit_filtered_stick(self, stick_name: str, raw_x: int, raw_y: int,
-                              out_x_code: int, out_y_code: int):
-        fx, fy = self.filter.filter_stick(raw_x, raw_y, stick=stick_name)
-        fx, x_changed = self.filter.suppress_jitter(f"{stick_name}_x", fx)
-        fy, y_changed = self.filter.suppress_jitter(f"{stick_name}_y", fy)
-        if x_changed or y_changed:
-            self.gamepad.emit_axis(out_x_code, fx)
-            self.gamepad.emit_axis(out_y_code, fy)
+                              out_x_code: int, out_y_code: int) -> None:
+        fx, fy, changed = self.filter.process_stick(raw_x, raw_y, stick_name, out_x_code, out_y_code)
+        if changed:
+            self._frame.events += ((_EV_ABS, out_x_code, fx), (_EV_ABS, out_y_code, fy))
+
+    def _syn(self) -> None:
+        """Flush this thread's pending events plus SYN_REPORT; no-op if nothing was emitted."""
+        events = self._frame.events
+        if events:
+            self.gamepad.emit_frame(events)
+            events.clear()
 
     def _reload_input_config(self) -> None:
         """Rebuild InputFilter from config (per-profile or global [input] section)."""
@@ -526,12 +596,10 @@ class BridgeService:
         from .constants import VIRTUAL_BUTTONS
         if self._rumble:
             self._rumble.stop()
-        for axis in (ecodes.ABS_X, ecodes.ABS_Y, ecodes.ABS_RX, ecodes.ABS_RY,
-                     ecodes.ABS_Z, ecodes.ABS_RZ, ecodes.ABS_HAT0X, ecodes.ABS_HAT0Y):
-            self.gamepad.emit_axis(axis, 0)
-        for code in VIRTUAL_BUTTONS:
-            self.gamepad.emit_button(code, 0)
-        self.gamepad.syn()
+        events = [(_EV_ABS, axis, 0) for axis in (
+            _ABS_X, _ABS_Y, _ABS_RX, _ABS_RY, _ABS_Z, _ABS_RZ, ecodes.ABS_HAT0X, ecodes.ABS_HAT0Y)]
+        events += [(_EV_KEY, code, 0) for code in VIRTUAL_BUTTONS]
+        self.gamepad.emit_frame(events)
         self._raw_left_x = self._raw_left_y = 0
         self._raw_right_x = self._raw_right_y = 0
 
@@ -569,7 +637,7 @@ class BridgeService:
                     try:
                         self._control.start()
                         self._control.set_input_callbacks(
-                            self._on_hid_button, self._on_hid_axis, self.gamepad.syn)
+                            self._on_hid_button, self._on_hid_axis, self._syn)
                     except OSError as e:
                         log.warning("Battery reader unavailable after reconnect: %s", e)
                         self._control = None
@@ -579,7 +647,7 @@ class BridgeService:
                 if discovered.hidraw_path:
                     from .hid import AnalogListener
                     self._analog = AnalogListener(discovered.hidraw_path,
-                                                  self._on_hid_axis, self.gamepad.syn)
+                                                  self._on_hid_axis, self._syn)
                     try:
                         self._analog.start()
                     except OSError as e:
@@ -603,6 +671,10 @@ class BridgeService:
     def _signal_handler(self, signum, frame):
         log.info("Received signal %d, shutting down...", signum)
         self._running = False
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass  # pipe full (already woken) or not yet created
 
     def _cleanup(self):
         log.info("Cleaning up...")
@@ -621,6 +693,10 @@ class BridgeService:
         self._stop_rgb()
         self._release_physical()
         self.gamepad.close()
+        for fd in (self._wake_r, self._wake_w):
+            if fd >= 0:
+                os.close(fd)
+        self._wake_r = self._wake_w = -1
         log.info("Cleanup complete")
 
 
@@ -76,13 +76,30 @@ DEFAULTS = {
 }
 
 
+# Parsed config keyed by the file's (mtime_ns, size, inode) so repeated lookups
+# (e.g. apply_audio_config on every wireless reconnect) cost one stat().
+_cfg_cache = {"key": None, "config": None}
+
+
 def load_config():
-    """Load config from disk, falling back to defaults if file is missing or malformed."""
-    config = configparser.ConfigParser()
-    for section, values in DEFAULTS.items():
-        config[section] = dict(values)
+    """Load config from disk, falling back to defaults if file is missing or malformed.
 
-    if os.path.isfile(CONFIG_PATH):
+    The parsed ConfigParser is cached and shared until the file changes on disk;
+    callers that modify it must persist the change with save_config().
+    """
+    try:
+        st = os.stat(CONFIG_PATH)
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    except OSError:
+        key = None
+    if _cfg_cache["config"] is not None and key == _cfg_cache["key"]:
+        return _cfg_cache["config"]
+
+    # No value uses %-interpolation; disabling it skips the interpolation pass on every get().
+    config = configparser.ConfigParser(interpolation=None)
+    config.read_dict(DEFAULTS)
+
+    if key is not None:
         try:
             config.read(CONFIG_PATH)
             log.debug("Loaded config from %s", CONFIG_PATH)
@@ -91,14 +108,21 @@ def load_config():
     else:
         log.debug("No config file at %s, using defaults", CONFIG_PATH)
 
+    _cfg_cache.update(key=key, config=config)
     return config
 
 
 def save_config(config):
     """Write config to disk, creating directory if needed."""
-    os.makedirs(CONFIG_DIR, mode=0o755, exist_ok=True)
-    with open(CONFIG_PATH, "w") as f:
-        config.write(f)
+    try:
+        os.makedirs(CONFIG_DIR, mode=0o755, exist_ok=True)
+        with open(CONFIG_PATH, "w") as f:
+            config.write(f)
+    except OSError:
+        # Callers mutate the shared cached parser before saving; drop it so the
+        # unsaved change isn't served until the file next changes on disk.
+        _cfg_cache.update(key=None, config=None)
+        raise
     log.info("Saved config to %s", CONFIG_PATH)
 
 
@@ -130,11 +154,11 @@ def battery_notifications_enabled() -> bool:
 
 
 def poll_timeout_ms() -> int:
-    """Return poll timeout in ms (default 2 = 500 Hz, matches hardware).
+    """Return event loop tick in ms while RGB activity tracking is idle/asleep (default 2).
 
-    Does not affect in-game input latency — the event loop is interrupt-driven
-    and wakes immediately on hardware events regardless of this value.
-    Increase only to reduce idle CPU on battery-powered systems.
+    Does not affect in-game input latency — the event loop blocks in epoll and
+    wakes immediately on hardware events, IPC requests and shutdown. The tick only
+    bounds how quickly the first input after idling restores the active RGB state.
     """
     return load_config().getint("driver", "poll_timeout_ms", fallback=2)
 
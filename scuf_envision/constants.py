@@ -13,6 +13,8 @@ translation layer entirely:
 Source for HID packet layout: OpenLinkHub (Go) scufenvisionproV2W.go
 """
 
+from array import array
+
 import evdev
 from evdev import ecodes
 
@@ -73,6 +75,16 @@ HID_BUTTON_MAP: dict[int, int] = {
 # Used by VirtualGamepad to register capabilities and by bridge to zero outputs on disconnect.
 VIRTUAL_BUTTONS: tuple[int, ...] = tuple(sorted(set(HID_BUTTON_MAP.values())))
 
+# Base (identity) button maps — HID input already yields canonical virtual codes.
+# Split into core buttons and paddles/extra keys for introspection and tests.
+BUTTON_MAP: dict[int, int] = {c: c for c in VIRTUAL_BUTTONS if c < ecodes.BTN_TRIGGER_HAPPY1}
+PADDLE_MAP: dict[int, int] = {c: c for c in VIRTUAL_BUTTONS if c >= ecodes.BTN_TRIGGER_HAPPY1}
+
+# Flat code -> code translation table indexed by key code (identity = passthrough).
+# ProfileManager overlays profile/layer overrides on a copy so the per-event lookup
+# is a single array index instead of a dict probe.
+BUTTON_LUT = array('H', range(ecodes.KEY_MAX + 1))
+
 # --- Axis mapping (legacy evdev) ---
 # Retained for reference only. Input is now read from raw HID packets, not evdev,
 # so this table is no longer applied at runtime.
@@ -104,6 +116,12 @@ AXIS_INFO = {
     ecodes.ABS_HAT0Y: evdev.AbsInfo(value=0, min=-1, max=1, fuzz=0, flat=0, resolution=0),
 }
 
+# uinput capabilities of the virtual gamepad (EV_FF is added at create() time when rumble is on).
+CAPABILITIES = {
+    ecodes.EV_KEY: list(VIRTUAL_BUTTONS),
+    ecodes.EV_ABS: list(AXIS_INFO.items()),
+}
+
 # --- Virtual device identity ---
 VIRTUAL_DEVICE_NAME = "SCUF Envision Pro V2 (Xbox Mode)"
 VIRTUAL_VENDOR = 0x045E   # Microsoft (so games recognize it as Xbox)
@@ -15,16 +15,35 @@ the correct device by:
 """
 
 import os
-import glob
 import logging
 import time
 from pathlib import Path
 from typing import Optional
 
+from evdev import ecodes
+
 from .constants import SCUF_VENDOR_ID, SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RECEIVER
 
 log = logging.getLogger(__name__)
 
+# Input-device uevent carries PRODUCT=<bus>/<vid>/<pid>/<ver> in unpadded lowercase hex.
+_UEVENT_PRODUCT_TAGS = tuple(f"/{SCUF_VENDOR_ID:x}/{pid:x}/".encode()
+                             for pid in (SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RECEIVER))
+
+# Last successful discovery, keyed on the mtimes of /dev/input and /dev. devtmpfs
+# bumps a directory's mtime whenever a node is created or removed under it, which
+# sysfs class directories do not, so these are the hotplug signal.
+_discovery_cache = {"key": None, "device": None}
+
+# At least one of these must be present for an evdev node to count as a gamepad.
+_GAMEPAD_BUTTON_SET = frozenset({
+    ecodes.BTN_SOUTH, ecodes.BTN_EAST,
+    ecodes.BTN_NORTH, ecodes.BTN_WEST,
+    ecodes.BTN_C, ecodes.BTN_Z,
+    ecodes.BTN_TL, ecodes.BTN_TR,
+    ecodes.BTN_TL2, ecodes.BTN_TR2,
+})
+
 
 class DiscoveredDevice:
     """Represents a discovered SCUF controller with its device paths."""
@@ -46,24 +65,63 @@ class DiscoveredDevice:
                 f"type={self.connection_type})")
 
 
-def _read_sysfs(path: str) -> str:
-    """Read a sysfs file, return empty string on failure."""
+def _read_sysfs_bytes(path: str) -> bytes:
+    """Read a sysfs file undecoded (everything we match is ASCII), b"" on failure."""
     try:
-        return Path(path).read_text().strip()
-    except (OSError, IOError):
-        return ""
+        return Path(path).read_bytes().strip()
+    except OSError:
+        return b""
 
 
-def _get_vid_pid(sysfs_path: str) -> tuple:
-    """Get (vendor_id, product_id) as ints from a sysfs input device path."""
-    vendor = _read_sysfs(os.path.join(sysfs_path, "device", "id", "vendor"))
-    product = _read_sysfs(os.path.join(sysfs_path, "device", "id", "product"))
+class _SysfsCache:
+    """Memoized sysfs reads, scoped to one discovery pass so nothing goes stale."""
+
+    def __init__(self):
+        self._data = {}
+
+    def read(self, path: str) -> bytes:
+        try:
+            return self._data[path]
+        except KeyError:
+            value = self._data[path] = _read_sysfs_bytes(path)
+            return value
+
+
+def _parse_uevent(sysfs_path: str, read=_read_sysfs_bytes) -> dict:
+    """Parse an input device's uevent (PRODUCT, NAME, PHYS, ...) into a dict."""
+    uevent = read(os.path.join(sysfs_path, "device", "uevent"))
+    return dict(line.split(b"=", 1) for line in uevent.splitlines() if b"=" in line)
+
+
+def _uevent_vid_pid(record: dict) -> tuple:
+    """(vendor_id, product_id) from a parsed uevent's PRODUCT=<bus>/<vid>/<pid>/<ver>."""
     try:
+        _, vendor, product = record[b"PRODUCT"].split(b"/")[:3]
         return int(vendor, 16), int(product, 16)
-    except ValueError:
+    except (KeyError, ValueError):
         return 0, 0
 
 
+def _get_vid_pid(sysfs_path: str, read=_read_sysfs_bytes) -> tuple:
+    """Get (vendor_id, product_id) as ints from a sysfs input device path."""
+    return _uevent_vid_pid(_parse_uevent(sysfs_path, read))
+
+
+def _class_entries(class_dir: str, prefix: str) -> list[str]:
+    """Paths of the entries in a /sys/class directory whose name starts with prefix."""
+    try:
+        with os.scandir(class_dir) as it:
+            return [e.path for e in it if e.name.startswith(prefix)]
+    except OSError:
+        return []
+
+
+def _quick_vid_pid_match(sysfs_path: str, read=_read_sysfs_bytes) -> bool:
+    """Cheap reject for non-SCUF input devices: one uevent read instead of two id/ reads."""
+    uevent = read(os.path.join(sysfs_path, "device", "uevent"))
+    return any(tag in uevent for tag in _UEVENT_PRODUCT_TAGS)
+
+
 def _event_number(sysfs_path: str) -> int:
     """Extract the numeric part of an event device path for sorting."""
     basename = os.path.basename(sysfs_path)
@@ -83,9 +141,10 @@ def _has_joystick_handler(sysfs_path: str) -> bool:
     """
     device_dir = os.path.join(sysfs_path, "device")
     try:
-        for entry in os.listdir(device_dir):
-            if entry.startswith("js"):
-                return True
+        with os.scandir(device_dir) as it:
+            for entry in it:
+                if entry.name.startswith("js"):
+                    return True
     except OSError:
         pass
     return False
@@ -106,31 +165,24 @@ def _has_gamepad_capabilities(event_path: str) -> bool:
         dev.close()
 
         # Must have both axes and buttons
-        if evdev.ecodes.EV_ABS not in caps or evdev.ecodes.EV_KEY not in caps:
+        if ecodes.EV_ABS not in caps or ecodes.EV_KEY not in caps:
             return False
 
         # Check for analog stick axes (ABS_X and ABS_Y at minimum)
-        abs_codes = set()
-        for entry in caps[evdev.ecodes.EV_ABS]:
+        has_x = has_y = False
+        for entry in caps[ecodes.EV_ABS]:
             code = entry[0] if isinstance(entry, tuple) else entry
-            abs_codes.add(code)
-
-        if evdev.ecodes.ABS_X not in abs_codes or evdev.ecodes.ABS_Y not in abs_codes:
+            if code == ecodes.ABS_X:
+                has_x = True
+            elif code == ecodes.ABS_Y:
+                has_y = True
+            if has_x and has_y:
+                break
+        else:
             return False
 
         # Check for gamepad buttons (at least one from BTN_SOUTH..BTN_THUMBR range)
-        btn_codes = set(caps[evdev.ecodes.EV_KEY])
-        gamepad_buttons = {
-            evdev.ecodes.BTN_SOUTH, evdev.ecodes.BTN_EAST,
-            evdev.ecodes.BTN_NORTH, evdev.ecodes.BTN_WEST,
-            evdev.ecodes.BTN_C, evdev.ecodes.BTN_Z,
-            evdev.ecodes.BTN_TL, evdev.ecodes.BTN_TR,
-            evdev.ecodes.BTN_TL2, evdev.ecodes.BTN_TR2,
-        }
-        if not btn_codes & gamepad_buttons:
-            return False
-
-        return True
+        return not _GAMEPAD_BUTTON_SET.isdisjoint(caps[ecodes.EV_KEY])
     except (OSError, PermissionError):
         return False
 
@@ -155,21 +207,43 @@ def discover_scuf() -> Optional[DiscoveredDevice]:
       4. Everything else is marked as secondary
 
     Returns a DiscoveredDevice with the primary gamepad event node,
-    or None if no controller is found.
+    or None if no controller is found. The last result is reused while no
+    device node has been added or removed since it was produced.
     """
+    try:
+        key = (os.stat("/dev/input").st_mtime_ns, os.stat("/dev").st_mtime_ns)
+    except OSError:
+        key = None
+    cached = _discovery_cache["device"]
+    if (key is not None and key == _discovery_cache["key"] and cached is not None
+            and os.path.exists(cached.event_path)):
+        log.debug(f"Reusing cached discovery result: {cached}")
+        return cached
+
+    device = _scan_for_scuf()
+    _discovery_cache.update(key=key, device=device)
+    return device
+
+
+def _scan_for_scuf() -> Optional[DiscoveredDevice]:
+    """Uncached sysfs walk behind discover_scuf()."""
     target_pids = {SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RECEIVER}
     matching_events = []
+    cache = _SysfsCache()
 
     # Scan /sys/class/input/event* devices, sorted numerically
-    sysfs_dirs = sorted(glob.glob("/sys/class/input/event*"), key=_event_number)
+    sysfs_dirs = sorted(_class_entries("/sys/class/input", "event"), key=_event_number)
     wired_count = 0
     wireless_count = 0
     for sysfs_dir in sysfs_dirs:
-        vid, pid = _get_vid_pid(sysfs_dir)
+        if not _quick_vid_pid_match(sysfs_dir, cache.read):
+            continue
+        record = _parse_uevent(sysfs_dir, cache.read)
+        vid, pid = _uevent_vid_pid(record)
         if vid == SCUF_VENDOR_ID and pid in target_pids:
             event_path = _find_event_node(sysfs_dir)
             if event_path:
-                name = _read_sysfs(os.path.join(sysfs_dir, "device", "name"))
+                name = record.get(b"NAME", b"").strip(b'"').decode(errors="replace")
                 has_js = _has_joystick_handler(sysfs_dir)
                 if pid == SCUF_PRODUCT_ID_WIRED:
                     wired_count += 1
@@ -221,8 +295,8 @@ def discover_scuf() -> Optional[DiscoveredDevice]:
         log.warning(f"Primary gamepad (fallback, first device): {primary}")
 
     # Find hidraw devices: gamepad interface (3) for rumble, control interface for config
-    hidraw_path = _find_hidraw_for_gamepad(primary)
-    control_hidraw_path = _find_control_hidraw(hidraw_path)
+    hidraw_path = _find_hidraw_for_gamepad(primary, cache.read)
+    control_hidraw_path = _find_control_hidraw(hidraw_path, cache.read)
 
     # Determine connection type from the matched PID
     conn_type = "wired"
@@ -267,7 +341,7 @@ def discover_scuf_with_retry(max_attempts: int = 15,
     return None
 
 
-def _find_hidraw_for_gamepad(event_path: str) -> Optional[str]:
+def _find_hidraw_for_gamepad(event_path: str, read=_read_sysfs_bytes) -> Optional[str]:
     """
     Find the hidraw device that shares the same USB interface as the
     primary gamepad event device.
@@ -295,15 +369,39 @@ def _find_hidraw_for_gamepad(event_path: str) -> Optional[str]:
             gamepad_interface_dir = check_path
             break
 
-    # Now find hidraw devices - prefer the one on the same USB interface
+    # The kernel groups hidraw nodes under their USB interface:
+    # <interface>/<hid device>/hidraw/hidrawN, so look there first.
+    if gamepad_interface_dir:
+        dev_path = _hidraw_under_interface(gamepad_interface_dir)
+        if dev_path:
+            log.debug(f"hidraw interface match: {dev_path}")
+            return dev_path
+
+    # Otherwise scan every hidraw - prefer the one on the same USB interface
     first_match = None
-    for hidraw_dir in sorted(glob.glob("/sys/class/hidraw/hidraw*")):
-        uevent_path = os.path.join(hidraw_dir, "device", "uevent")
-        uevent = _read_sysfs(uevent_path)
+    for hidraw_dir, dev_path in _scuf_hidraw_nodes(read):
+        if first_match is None:
+            first_match = dev_path
+
+        # Check if this hidraw is on the same USB interface
+        if gamepad_interface_dir:
+            hidraw_real = os.path.realpath(hidraw_dir)
+            if gamepad_interface_dir in hidraw_real:
+                log.debug(f"hidraw interface match: {dev_path}")
+                return dev_path
+
+    # Fallback: return the first VID:PID match
+    return first_match
+
+
+def _scuf_hidraw_nodes(read=_read_sysfs_bytes):
+    """Yield (sysfs dir, /dev path) for each present hidraw node with a SCUF VID:PID."""
+    for hidraw_dir in sorted(_class_entries("/sys/class/hidraw", "hidraw")):
+        uevent = read(os.path.join(hidraw_dir, "device", "uevent"))
         for line in uevent.splitlines():
-            if line.startswith("HID_ID="):
+            if line.startswith(b"HID_ID="):
                 # Format: HID_ID=0003:00001B1C:00003A05
-                parts = line.split("=", 1)[1].split(":")
+                parts = line.split(b"=", 1)[1].split(b":")
                 if len(parts) >= 3:
                     try:
                         vid = int(parts[1], 16)
@@ -312,21 +410,28 @@ def _find_hidraw_for_gamepad(event_path: str) -> Optional[str]:
                         continue
                     if vid == SCUF_VENDOR_ID and pid in (SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RECEIVER):
                         dev_path = f"/dev/{os.path.basename(hidraw_dir)}"
-                        if not os.path.exists(dev_path):
-                            continue
+                        if os.path.exists(dev_path):
+                            yield hidraw_dir, dev_path
 
-                        if first_match is None:
-                            first_match = dev_path
 
-                        # Check if this hidraw is on the same USB interface
-                        if gamepad_interface_dir:
-                            hidraw_real = os.path.realpath(hidraw_dir)
-                            if gamepad_interface_dir in hidraw_real:
-                                log.debug(f"hidraw interface match: {dev_path}")
-                                return dev_path
-
-    # Fallback: return the first VID:PID match
-    return first_match
+def _hidraw_under_interface(interface_dir: str) -> Optional[str]:
+    """First /dev/hidrawN node belonging to a HID device under a USB interface dir."""
+    try:
+        with os.scandir(interface_dir) as it:
+            hid_dirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return None
+    for hid_dir in hid_dirs:
+        try:
+            with os.scandir(os.path.join(hid_dir, "hidraw")) as it:
+                for entry in it:
+                    if entry.name.startswith("hidraw"):
+                        dev_path = f"/dev/{entry.name}"
+                        if os.path.exists(dev_path):
+                            return dev_path
+        except OSError:
+            continue
+    return None
 
 
 def find_competing_gamepads() -> list[str]:
@@ -362,7 +467,7 @@ def find_competing_gamepads() -> list[str]:
     return competing
 
 
-def _find_control_hidraw(gamepad_hidraw: Optional[str]) -> Optional[str]:
+def _find_control_hidraw(gamepad_hidraw: Optional[str], read=_read_sysfs_bytes) -> Optional[str]:
     """
     Find the control hidraw device for sending configuration commands
     (vibration module intensity, etc.).
@@ -371,20 +476,7 @@ def _find_control_hidraw(gamepad_hidraw: Optional[str]) -> Optional[str]:
     interface hidraw. OpenLinkHub uses the first enumerated HID device
     for control commands.
     """
-    for hidraw_dir in sorted(glob.glob("/sys/class/hidraw/hidraw*")):
-        uevent_path = os.path.join(hidraw_dir, "device", "uevent")
-        uevent = _read_sysfs(uevent_path)
-        for line in uevent.splitlines():
-            if line.startswith("HID_ID="):
-                parts = line.split("=", 1)[1].split(":")
-                if len(parts) >= 3:
-                    try:
-                        vid = int(parts[1], 16)
-                        pid = int(parts[2], 16)
-                    except ValueError:
-                        continue
-                    if vid == SCUF_VENDOR_ID and pid in (SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RECEIVER):
-                        dev_path = f"/dev/{os.path.basename(hidraw_dir)}"
-                        if os.path.exists(dev_path) and dev_path != gamepad_hidraw:
-                            return dev_path
+    for _, dev_path in _scuf_hidraw_nodes(read):
+        if dev_path != gamepad_hidraw:
+            return dev_path
     return None
@@ -4,6 +4,11 @@ and piecewise-linear response curves (OLH-compatible 6-point format).
 """
 
 import math
+from array import array
+
+from evdev import ecodes
+
+from ._filters import _filter_stick
 from .constants import (
     STICK_DEADZONE, TRIGGER_DEADZONE, STICK_JITTER_THRESHOLD,
     STICK_MIN, STICK_MAX, TRIGGER_MIN, TRIGGER_MAX,
@@ -18,6 +23,10 @@ CURVE_PRESETS = {
     'relaxed':    [(0,0),(20,2), (40,10),(60,28),(80,58),(100,100)],  # ~power 3
 }
 
+# Jitter slot value meaning "nothing emitted yet": far enough from any axis value
+# that the first sample always passes the threshold.
+_JITTER_UNSET = -(1 << 30)
+
 
 def _apply_curve(t: float, points: list) -> float:
     """Piecewise linear interpolation through curve control points.
@@ -62,8 +71,17 @@ class InputFilter:
         self.stick_curve = stick_curve if stick_curve is not None else CURVE_PRESETS['linear']
         self.trigger_curve = trigger_curve if trigger_curve is not None else CURVE_PRESETS['linear']
 
-        # Last output values for jitter suppression
-        self._last = {}
+        # Per-stick (deadzone, deadzone², STICK_MAX - deadzone, anti_dz), precomputed so
+        # the idle path is a squared-magnitude compare with no sqrt. The range stays a
+        # divisor: multiplying by its reciprocal rounds full deflection to STICK_MAX - 1.
+        self._stick_params = {
+            side: (dz, dz * dz, max(1, STICK_MAX - dz), anti)
+            for side, dz, anti in (('left', left_stick_deadzone, left_stick_anti_dz),
+                                   ('right', right_stick_deadzone, right_stick_anti_dz))
+        }
+
+        # Last output value per output axis code, for jitter suppression
+        self._last = array('i', [_JITTER_UNSET]) * (ecodes.ABS_MAX + 1)
 
     def filter_stick(self, x: int, y: int, stick: str = 'left') -> tuple:
         """
@@ -75,22 +93,16 @@ class InputFilter:
 
         Returns (filtered_x, filtered_y).
         """
-        deadzone = self.left_stick_deadzone if stick == 'left' else self.right_stick_deadzone
-        anti_dz = self.left_stick_anti_dz if stick == 'left' else self.right_stick_anti_dz
-
-        magnitude = math.sqrt(x * x + y * y)
-
-        if magnitude < deadzone:
-            return 0, 0
+        deadzone, dz_sq, dz_range, anti_dz = self._stick_params[
+            'left' if stick == 'left' else 'right']
 
         # Scale so deadzone edge → 0, max deflection → STICK_MAX, then shape
-        scale = min((magnitude - deadzone) / (STICK_MAX - deadzone), 1.0)
+        magnitude, scale = _filter_stick(x, y, deadzone, dz_sq, dz_range)
+        if not magnitude:
+            return 0, 0
         scale = _apply_curve(scale, self.stick_curve)
 
-        if magnitude > 0:
-            nx, ny = x / magnitude, y / magnitude
-        else:
-            nx, ny = 0.0, 0.0
+        nx, ny = x / magnitude, y / magnitude
 
         out_x = int(nx * scale * STICK_MAX)
         out_y = int(ny * scale * STICK_MAX)
@@ -105,8 +117,15 @@ class InputFilter:
                 out_x = int(out_x * ratio)
                 out_y = int(out_y * ratio)
 
-        out_x = max(STICK_MIN, min(STICK_MAX, out_x))
-        out_y = max(STICK_MIN, min(STICK_MAX, out_y))
+        # Clamping is almost always a no-op here, so compare instead of min/max calls
+        if out_x > STICK_MAX:
+            out_x = STICK_MAX
+        elif out_x < STICK_MIN:
+            out_x = STICK_MIN
+        if out_y > STICK_MAX:
+            out_y = STICK_MAX
+        elif out_y < STICK_MIN:
+            out_y = STICK_MIN
 
         return out_x, out_y
 
@@ -127,14 +146,42 @@ class InputFilter:
         t = (value - deadzone) / (TRIGGER_MAX - deadzone)
         return int(_apply_curve(t, self.trigger_curve) * TRIGGER_MAX)
 
-    def suppress_jitter(self, key: str, new_value: int) -> tuple:
+    def suppress_jitter(self, code: int, new_value: int) -> tuple:
         """
-        Suppress jitter on a value. Returns (value, changed).
+        Suppress jitter on the output axis `code`. Returns (value, changed).
 
         If the change is smaller than the threshold, returns the old value.
         """
-        old = self._last.get(key, None)
-        if old is not None and abs(new_value - old) < self.jitter_threshold:
+        old = self._last[code]
+        if abs(new_value - old) < self.jitter_threshold:
             return old, False
-        self._last[key] = new_value
+        self._last[code] = new_value
         return new_value, True
+
+    def process_stick(self, x: int, y: int, stick: str, code_x: int, code_y: int) -> tuple:
+        """
+        filter_stick followed by suppress_jitter on both axes, fused into one call.
+
+        Returns (x, y, changed) where changed is True if either axis moved past
+        the jitter threshold.
+        """
+        fx, fy = self.filter_stick(x, y, stick)
+        last, threshold = self._last, self.jitter_threshold
+        changed = False
+        old = last[code_x]
+        if abs(fx - old) < threshold:
+            fx = old
+        else:
+            last[code_x] = fx
+            changed = True
+        old = last[code_y]
+        if abs(fy - old) < threshold:
+            fy = old
+        else:
+            last[code_y] = fy
+            changed = True
+        return fx, fy, changed
+
+    def process_trigger(self, value: int, side: str, code: int) -> tuple:
+        """filter_trigger followed by suppress_jitter. Returns (value, changed)."""
+        return self.suppress_jitter(code, self.filter_trigger(value, side))
@@ -2,11 +2,12 @@
 
 import configparser
 import logging
+from array import array
 from dataclasses import dataclass, field
 
 from evdev import ecodes
 
-from .constants import HID_BUTTON_MAP
+from .constants import BUTTON_LUT, HID_BUTTON_MAP
 
 log = logging.getLogger(__name__)
 
@@ -151,6 +152,7 @@ class ProfileManager:
         self._macros: dict[str, dict[int, Macro]] = macros or {}
         self._active = "default"
         self._effective: dict[int, int] = dict(_BASE_MAP)
+        self._effective_lut = BUTTON_LUT
 
     @property
     def active_name(self) -> str:
@@ -160,6 +162,11 @@ class ProfileManager:
     def effective_button_map(self) -> dict[int, int]:
         return self._effective
 
+    @property
+    def effective_button_lut(self) -> array:
+        """effective_button_map as a flat array indexed by physical code (unmapped = identity)."""
+        return self._effective_lut
+
     @property
     def active_layer(self) -> str | None:
         lc = self._layer_configs.get(self._active)
@@ -185,6 +192,11 @@ class ProfileManager:
         lc = self._layer_configs.get(self._active)
         layer_ovr = lc.layers.get(lc.stack[lc.active_idx], {}) if lc and lc.stack else {}
         self._effective = {**_BASE_MAP, **overrides, **layer_ovr}
+        lut = BUTTON_LUT[:]
+        for src, dst in self._effective.items():
+            if src < len(lut):  # config may name non-key codes (e.g. KEY_CNT)
+                lut[src] = dst
+        self._effective_lut = lut
 
     def switch(self, name: str) -> None:
         """Switch to a named profile. Raises KeyError if not found."""
@@ -6,16 +6,45 @@ Games and Steam see this as a normal Xbox gamepad with correct button mappings.
 """
 
 import logging
+import os
+import struct
+import threading
+from functools import partial
+
 import evdev
 from evdev import ecodes, UInput
 
 from .constants import (
     VIRTUAL_DEVICE_NAME, VIRTUAL_VENDOR, VIRTUAL_PRODUCT, VIRTUAL_VERSION,
-    AXIS_INFO, VIRTUAL_BUTTONS, FF_MAX_EFFECTS,
+    CAPABILITIES, FF_MAX_EFFECTS,
 )
 
 log = logging.getLogger(__name__)
 
+# struct input_event: timeval (two native longs), type, code, value. uinput ignores
+# the timestamp and accepts several concatenated events in a single write().
+_INPUT_EVENT = struct.Struct("llHHi")
+_EVENT_SIZE = _INPUT_EVENT.size
+_pack_into = _INPUT_EVENT.pack_into
+_TX_EVENTS = 32  # initial per-thread buffer capacity, grown if a frame exceeds it
+_EV_SYN, _SYN_REPORT = ecodes.EV_SYN, ecodes.SYN_REPORT
+
+
+def _discard(data) -> int:
+    return 0
+
+
+class _TxBuffer(threading.local):
+    """Per-thread frame buffer: HID readers, macros and the main loop emit concurrently."""
+
+    def __init__(self):
+        self.buf = bytearray(_EVENT_SIZE * _TX_EVENTS)
+
+    def reserve(self, size: int):
+        """Grow the buffer to at least size bytes."""
+        if size > len(self.buf):
+            self.buf.extend(bytes(max(size, 2 * len(self.buf)) - len(self.buf)))
+
 
 class VirtualGamepad:
     """uinput virtual Xbox gamepad."""
@@ -23,6 +52,10 @@ class VirtualGamepad:
     def __init__(self):
         self._device = None
         self._rumble_enabled = False
+        self._tx = _TxBuffer()
+        # Bound to os.write on the uinput fd while the device exists, so emit_frame()
+        # needs no per-frame device check.
+        self._write = _discard
 
     def create(self, rumble: bool = False):
         """Create the virtual gamepad device.
@@ -33,19 +66,10 @@ class VirtualGamepad:
         """
         self._rumble_enabled = rumble
 
-        all_buttons = VIRTUAL_BUTTONS
-
-        # Axes with their AbsInfo
-        all_axes = [(code, info) for code, info in AXIS_INFO.items()]
-
-        capabilities = {
-            ecodes.EV_KEY: all_buttons,
-            ecodes.EV_ABS: all_axes,
-        }
-
+        capabilities = CAPABILITIES
         ff_effects_max = 0
         if rumble:
-            capabilities[ecodes.EV_FF] = [ecodes.FF_RUMBLE, ecodes.FF_GAIN]
+            capabilities = {**CAPABILITIES, ecodes.EV_FF: [ecodes.FF_RUMBLE, ecodes.FF_GAIN]}
             ff_effects_max = FF_MAX_EFFECTS
 
         self._device = UInput(
@@ -56,29 +80,29 @@ class VirtualGamepad:
             version=VIRTUAL_VERSION,
             max_effects=ff_effects_max,
         )
+        self._write = partial(os.write, self._device.fd)
 
         log.info(f"Created virtual gamepad: {self._device.device.path}"
                  f"{' (rumble enabled)' if rumble else ''}")
 
-    def emit_button(self, code: int, value: int):
-        """Emit a button press/release event."""
-        if self._device:
-            self._device.write(ecodes.EV_KEY, code, value)
-
-    def emit_axis(self, code: int, value: int):
-        """Emit an axis value change."""
-        if self._device:
-            self._device.write(ecodes.EV_ABS, code, value)
-
-    def syn(self):
-        """Send a SYN_REPORT to flush pending events."""
-        if self._device:
-            self._device.syn()
+    def emit_frame(self, events: list[tuple[int, int, int]]):
+        """Emit (type, code, value) events followed by SYN_REPORT in one write()."""
+        tx = self._tx
+        tx.reserve(_EVENT_SIZE * (len(events) + 1))  # +1 for the SYN_REPORT
+        buf, pack_into = tx.buf, _pack_into
+        offset = 0
+        for etype, code, value in events:
+            pack_into(buf, offset, 0, 0, etype, code, value)
+            offset += _EVENT_SIZE
+        pack_into(buf, offset, 0, 0, _EV_SYN, _SYN_REPORT, 0)
+        # Zero-copy slice; the temporary view is gone before the next reserve()
+        self._write(memoryview(buf)[:offset + _EVENT_SIZE])
 
     def close(self):
         """Destroy the virtual device."""
         if self._device:
             log.info("Destroying virtual gamepad")
+            self._write = _discard
             self._device.close()
             self._device = None
 
@@ -0,0 +1,54 @@
+"""Unit tests for the load_config() cache."""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scuf_envision import config
+
+
+class TestConfigCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.path = os.path.join(self.dir, "config.ini")
+        for name, value in (("CONFIG_DIR", self.dir), ("CONFIG_PATH", self.path)):
+            patcher = mock.patch.object(config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        config._cfg_cache.update(key=None, config=None)
+        self.addCleanup(config._cfg_cache.update, key=None, config=None)
+
+    def _write(self, text):
+        with open(self.path, "w") as f:
+            f.write(text)
+
+    def test_unchanged_file_returns_cached_parser(self):
+        self._write("[audio]\ndisabled = true\n")
+        self.assertIs(config.load_config(), config.load_config())
+
+    def test_changed_file_is_reparsed(self):
+        self._write("[audio]\ndisabled = true\n")
+        self.assertTrue(config.is_audio_disabled())
+        self._write("[audio]\ndisabled = false\n\n")  # size differs even if mtime doesn't
+        self.assertFalse(config.is_audio_disabled())
+
+    def test_failed_save_does_not_leave_change_cached(self):
+        self._write("[audio]\ndisabled = false\n")
+        self.assertFalse(config.is_audio_disabled())
+        # A regular file where the config dir should be makes makedirs() fail
+        blocker = os.path.join(self.dir, "not-a-dir")
+        open(blocker, "w").close()
+        with mock.patch.object(config, "CONFIG_DIR", blocker):
+            with self.assertRaises(OSError):
+                config.set_audio_disabled(True)
+        self.assertFalse(config.is_audio_disabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scuf_envision.input_filter import InputFilter
 from scuf_envision.constants import STICK_MAX, STICK_MIN
+from evdev.ecodes import ABS_X, ABS_Y, ABS_Z, ABS_RX, ABS_RY
 
 
 def make_filter(**kw):
@@ -141,41 +142,65 @@ class TestJitter(unittest.TestCase):
 
     def test_first_call_always_changed(self):
         f = make_filter(jitter_threshold=32)
-        val, changed = f.suppress_jitter('x', 500)
+        val, changed = f.suppress_jitter(ABS_X, 500)
         self.assertEqual(val, 500)
         self.assertTrue(changed)
 
     def test_small_change_suppressed(self):
         f = make_filter(jitter_threshold=32)
-        f.suppress_jitter('x', 500)
-        val, changed = f.suppress_jitter('x', 515)  # delta=15 < 32
+        f.suppress_jitter(ABS_X, 500)
+        val, changed = f.suppress_jitter(ABS_X, 515)  # delta=15 < 32
         self.assertEqual(val, 500)
         self.assertFalse(changed)
 
     def test_large_change_passes(self):
         f = make_filter(jitter_threshold=32)
-        f.suppress_jitter('x', 500)
-        val, changed = f.suppress_jitter('x', 535)  # delta=35 ≥ 32
+        f.suppress_jitter(ABS_X, 500)
+        val, changed = f.suppress_jitter(ABS_X, 535)  # delta=35 ≥ 32
         self.assertEqual(val, 535)
         self.assertTrue(changed)
 
     def test_independent_keys(self):
         f = make_filter(jitter_threshold=32)
-        f.suppress_jitter('x', 500)
-        f.suppress_jitter('y', 200)
+        f.suppress_jitter(ABS_X, 500)
+        f.suppress_jitter(ABS_Y, 200)
         # Small change on x suppressed, but y is independent
-        _, x_changed = f.suppress_jitter('x', 510)
-        _, y_changed = f.suppress_jitter('y', 240)
+        _, x_changed = f.suppress_jitter(ABS_X, 510)
+        _, y_changed = f.suppress_jitter(ABS_Y, 240)
         self.assertFalse(x_changed)
         self.assertTrue(y_changed)
 
     def test_zero_threshold_always_passes(self):
         f = make_filter(jitter_threshold=0)
-        f.suppress_jitter('x', 500)
-        val, changed = f.suppress_jitter('x', 501)
+        f.suppress_jitter(ABS_X, 500)
+        val, changed = f.suppress_jitter(ABS_X, 501)
         self.assertEqual(val, 501)
         self.assertTrue(changed)
 
 
+class TestFused(unittest.TestCase):
+    """process_stick/process_trigger must match the unfused filter + jitter calls."""
+
+    def test_stick_matches_unfused(self):
+        fused, plain = make_filter(), make_filter()
+        for x, y in ((0, 0), (5000, -3000), (5010, -2990), (20000, 100), (-32768, 32767)):
+            fx, fy = plain.filter_stick(x, y, stick='right')
+            fx, x_changed = plain.suppress_jitter(ABS_RX, fx)
+            fy, y_changed = plain.suppress_jitter(ABS_RY, fy)
+            self.assertEqual(fused.process_stick(x, y, 'right', ABS_RX, ABS_RY),
+                             (fx, fy, x_changed or y_changed))
+
+    def test_stick_small_move_unchanged(self):
+        f = make_filter(jitter_threshold=32)
+        x, y, _ = f.process_stick(10000, 0, 'left', ABS_X, ABS_Y)
+        self.assertEqual(f.process_stick(10010, 0, 'left', ABS_X, ABS_Y), (x, y, False))
+
+    def test_trigger_matches_unfused(self):
+        fused, plain = make_filter(), make_filter()
+        for v in (0, 300, 310, 1023):
+            expected = plain.suppress_jitter(ABS_Z, plain.filter_trigger(v, side='left'))
+            self.assertEqual(fused.process_trigger(v, 'left', ABS_Z), expected)
+
+
 if __name__ == '__main__':
     unittest.main()
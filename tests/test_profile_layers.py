@@ -155,6 +155,16 @@ BTN_TRIGGER_HAPPY1 = BTN_NORTH
         mgr.cycle_layer()
         self.assertEqual(mgr.effective_button_map[P1], X)   # stealth: P1→X
 
+    def test_effective_lut_tracks_map(self):
+        mgr = self._mgr()
+        mgr.switch("GAME")
+        for _ in range(3):
+            lut = mgr.effective_button_lut
+            for src, dst in mgr.effective_button_map.items():
+                self.assertEqual(lut[src], dst)
+            self.assertEqual(lut[ecodes.KEY_A], ecodes.KEY_A)  # unmapped: pass-through
+            mgr.cycle_layer()
+
 
 class TestSwitchLayer(unittest.TestCase):
 
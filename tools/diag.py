@@ -14,19 +14,28 @@ Press Ctrl+C to exit.
 
 import sys
 import os
-import glob
 import argparse
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import evdev
-from evdev import ecodes, categorize
+from evdev import ecodes
+import queue
 import select
 import struct
+import threading
+import time
 
-from scuf_envision.discovery import discover_scuf, discover_scuf_with_retry, _get_vid_pid, _has_joystick_handler, _event_number
-from scuf_envision.constants import (HID_BUTTON_MAP, HID_DPAD, HID_BTN_MASK_OFFSET,
+from scuf_envision.discovery import (discover_scuf_with_retry, _get_vid_pid,
+                                     _has_joystick_handler, _event_number, _read_sysfs_bytes,
+                                     _class_entries, _GAMEPAD_BUTTON_SET)
+from scuf_envision.constants import (HID_DPAD, HID_BTN_MASK_OFFSET,
                                      SCUF_VENDOR_ID, SCUF_PRODUCT_ID_WIRED,
                                      SCUF_PRODUCT_ID_RECEIVER, VIRTUAL_DEVICE_NAME)
+from scuf_envision.virtual_gamepad import _INPUT_EVENT, _EVENT_SIZE
 
 # ANSI color codes
 RED = "\033[91m"
@@ -113,6 +122,76 @@ VIRTUAL_AXIS_NAMES = {
 }
 
 
+def _line_labels(prefix: str, names: dict) -> dict[int, bytes]:
+    """Pre-encode the fixed-width "<prefix><name> " head of each event-monitor line."""
+    return {code: f"{prefix}{name:45s} ".encode() for code, name in names.items()}
+
+
+# Event monitor line heads, built once so the per-event path is a dict lookup + concat
+SCUF_BUTTON_LABELS = _line_labels("BUTTON: ", SCUF_BUTTON_NAMES)
+SCUF_AXIS_LABELS = _line_labels("AXIS:   ", SCUF_AXIS_NAMES)
+VIRTUAL_BUTTON_LABELS = _line_labels("BUTTON: ", VIRTUAL_BUTTON_NAMES)
+VIRTUAL_AXIS_LABELS = _line_labels("AXIS:   ", VIRTUAL_AXIS_NAMES)
+BTN_PRESSED = b"PRESSED\n"
+BTN_RELEASED = b"RELEASED\n"
+
+
+_READ_EVENTS = 64
+_FLUSH_INTERVAL = 0.016
+_IDLE_TIMEOUT = 1.0
+
+
+class _EventReader:
+    """Batched evdev reader: sleeps in epoll while idle, then drains up to 64 events per read()."""
+
+    def __init__(self, fd: int):
+        self._fd = fd
+        self._buf = bytearray(_EVENT_SIZE * _READ_EVENTS)
+        self._ep = select.epoll()
+        self._ep.register(fd, select.EPOLLIN)
+
+    def read(self, timeout: float = _IDLE_TIMEOUT) -> list[tuple[int, int, int]]:
+        """Non-SYN (type, code, value) events from one read(); [] if idle for timeout seconds."""
+        if not self._ep.poll(timeout):
+            return []
+        n = os.readv(self._fd, [self._buf])
+        syn = ecodes.EV_SYN
+        return [(etype, code, value)
+                for _, _, etype, code, value in _INPUT_EVENT.iter_unpack(memoryview(self._buf)[:n])
+                if etype != syn]
+
+    def close(self):
+        self._ep.close()
+
+
+class _OutputThread:
+    """Writes stdout chunks from a daemon thread.
+
+    A slow terminal (ssh, serial console) can block write() for longer than the
+    kernel's per-client evdev buffer lasts at stick event rates, and events past
+    that are dropped. os.write releases the GIL, so the reader keeps draining.
+    """
+
+    def __init__(self):
+        self._out = sys.stdout.buffer
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, data: bytes):
+        self._queue.put(data)
+
+    def _run(self):
+        while (data := self._queue.get()) is not None:
+            self._out.write(data)
+            self._out.flush()
+
+    def close(self):
+        """Flush everything queued so far and stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+
 def find_virtual_device():
     """Find the bridge's virtual Xbox gamepad if it exists."""
     for path in evdev.list_devices():
@@ -126,114 +205,193 @@ def find_virtual_device():
     return None
 
 
-def scan_all_scuf_devices():
-    """Show every event device matching SCUF VID:PID with its capabilities."""
+_LONG_BITS = struct.calcsize("l") * 8
+
+
+def _flat_names(*tables: dict) -> dict[int, str]:
+    """code -> single name; aliased codes map to a list/tuple of names, keep the first."""
+    return {code: name if isinstance(name, str) else name[0]
+            for table in tables for code, name in table.items()}
+
+
+# Later tables win, so BTN_* names take precedence over KEY_* for shared codes
+_BTN_FLAT = _flat_names(ecodes.KEY, ecodes.BTN)
+_ABS_FLAT = _flat_names(ecodes.ABS)
+
+# HID_ID=<bus>:<vendor>:<product>, each zero-padded to 8 hex digits (e.g. 0003:00001B1C:00003A05)
+_HID_ID_RE = re.compile(rb"^HID_ID=[0-9A-Fa-f]+:([0-9A-Fa-f]+):([0-9A-Fa-f]+)", re.M)
+
+
+def _sysfs_bitmap(text: bytes) -> list[int]:
+    """Decode a sysfs capability bitmap (hex longs, most significant first) into codes."""
+    codes = []
+    for i, word in enumerate(reversed(text.split())):
+        bits = int(word, 16)
+        while bits:
+            low = bits & -bits
+            codes.append(i * _LONG_BITS + low.bit_length() - 1)
+            bits ^= low
+    return codes
+
+
+def _sysfs_capabilities(sysfs_dir: str) -> dict:
+    """EV_KEY/EV_ABS codes from device/capabilities/, shaped like capabilities(verbose=False)."""
+    caps = {}
+    for etype, attr in ((ecodes.EV_KEY, "key"), (ecodes.EV_ABS, "abs")):
+        codes = _sysfs_bitmap(_read_sysfs_bytes(f"{sysfs_dir}/device/capabilities/{attr}"))
+        if codes:
+            caps[etype] = codes
+    return caps
+
+
+@dataclass
+class ProbeResult:
+    """One SCUF event node from scan_all_scuf_devices, with its report lines."""
+    event_path: str
+    pid: int
+    has_js: bool
+    lines: list[str]
+    is_gamepad: bool = False
+
+
+def _probe(sysfs_dir: str, deep: bool = False) -> ProbeResult | None:
+    """Describe one /sys/class/input/eventN entry, or None if it is not a SCUF device."""
+    vid, pid = _get_vid_pid(sysfs_dir)
+    if vid != SCUF_VENDOR_ID or pid not in (SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RECEIVER):
+        return None
+    event_path = f"/dev/input/{os.path.basename(sysfs_dir)}"
+    has_js = _has_joystick_handler(sysfs_dir)
+    result = ProbeResult(event_path, pid, has_js, [])
+    lines = result.lines
+
+    if deep:
+        try:
+            dev = evdev.InputDevice(event_path)
+            caps = dev.capabilities(verbose=False)
+            dev_name = dev.name
+            dev_phys = dev.phys
+            dev.close()
+        except (OSError, PermissionError) as e:
+            lines.append(f"  {event_path}: cannot open ({e})")
+            return result
+    else:
+        caps = _sysfs_capabilities(sysfs_dir)
+        dev_name = _read_sysfs_bytes(f"{sysfs_dir}/device/name").decode(errors="replace")
+        dev_phys = _read_sysfs_bytes(f"{sysfs_dir}/device/phys").decode(errors="replace")
+
+    conn_label = "WIRELESS" if pid == SCUF_PRODUCT_ID_RECEIVER else "WIRED"
+    js_label = " [JOYSTICK]" if has_js else ""
+    lines.append(f"  {event_path}{js_label} ({conn_label})")
+    lines.append(f"    Name: {dev_name}")
+    lines.append(f"    Phys: {dev_phys}")
+
+    key_codes = caps.get(ecodes.EV_KEY, ())
+    abs_codes = [e[0] if isinstance(e, tuple) else e for e in caps.get(ecodes.EV_ABS, ())]
+    result.is_gamepad = (has_js and ecodes.ABS_X in abs_codes
+                         and not _GAMEPAD_BUTTON_SET.isdisjoint(key_codes))
+
+    # Summarize capabilities
+    if key_codes:
+        # Only the first 15 are shown, so only resolve those (keyboards list hundreds)
+        btn_names = [_BTN_FLAT.get(code) or f"0x{code:03x}" for code in key_codes[:15]]
+        lines.append(f"    Buttons ({len(key_codes)}): {', '.join(str(b) for b in btn_names)}"
+                     + (" ..." if len(key_codes) > 15 else ""))
+    else:
+        lines.append("    Buttons: none")
+
+    if abs_codes:
+        axis_names = [_ABS_FLAT.get(code) or f"0x{code:02x}" for code in abs_codes]
+        lines.append(f"    Axes ({len(axis_names)}): {', '.join(str(a) for a in axis_names)}")
+    else:
+        lines.append("    Axes: none")
+
+    lines.append("")
+    return result
+
+
+def scan_all_scuf_devices(deep: bool = False, quick: bool = False):
+    """Show every event device matching SCUF VID:PID with its capabilities.
+
+    Name, phys and capabilities come from sysfs; deep=True opens each evdev node
+    instead, which can block for a long time on a busy or grabbed device.
+    quick=True stops at the first joystick node with ABS_X and gamepad buttons
+    (the one discovery prefers), so the listing may be partial.
+    """
     print("Scanning all SCUF event devices...")
     print()
 
-    target_pids = {SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RECEIVER}
-    sysfs_dirs = sorted(glob.glob("/sys/class/input/event*"), key=_event_number)
+    sysfs_dirs = sorted(_class_entries("/sys/class/input", "event"), key=_event_number)
     found = []
     wired_count = 0
     wireless_count = 0
 
-    for sysfs_dir in sysfs_dirs:
-        vid, pid = _get_vid_pid(sysfs_dir)
-        if vid == SCUF_VENDOR_ID and pid in target_pids:
-            event_name = os.path.basename(sysfs_dir)
-            event_path = f"/dev/input/{event_name}"
-            has_js = _has_joystick_handler(sysfs_dir)
-            found.append((event_path, has_js))
-            if pid == SCUF_PRODUCT_ID_WIRED:
-                wired_count += 1
-            else:
-                wireless_count += 1
-
-            try:
-                dev = evdev.InputDevice(event_path)
-                caps = dev.capabilities(verbose=False)
-                dev_name = dev.name
-                dev_phys = dev.phys
-                dev.close()
-            except (OSError, PermissionError) as e:
-                print(f"  {event_path}: cannot open ({e})")
-                continue
-
-            conn_label = "WIRELESS" if pid == SCUF_PRODUCT_ID_RECEIVER else "WIRED"
-            js_label = " [JOYSTICK]" if has_js else ""
-            print(f"  {event_path}{js_label} ({conn_label})")
-            print(f"    Name: {dev_name}")
-            print(f"    Phys: {dev_phys}")
-
-            # Summarize capabilities
-            if ecodes.EV_KEY in caps:
-                btn_names = []
-                for code in caps[ecodes.EV_KEY]:
-                    name = ecodes.BTN.get(code) or ecodes.KEY.get(code) or f"0x{code:03x}"
-                    if isinstance(name, list):
-                        name = name[0]
-                    btn_names.append(name)
-                print(f"    Buttons ({len(btn_names)}): {', '.join(str(b) for b in btn_names[:15])}"
-                      + (" ..." if len(btn_names) > 15 else ""))
-            else:
-                print("    Buttons: none")
-
-            if ecodes.EV_ABS in caps:
-                axis_names = []
-                for entry in caps[ecodes.EV_ABS]:
-                    code = entry[0] if isinstance(entry, tuple) else entry
-                    name = ecodes.ABS.get(code, f"0x{code:02x}")
-                    if isinstance(name, list):
-                        name = name[0]
-                    axis_names.append(name)
-                print(f"    Axes ({len(axis_names)}): {', '.join(str(a) for a in axis_names)}")
-            else:
-                print("    Axes: none")
-
-            print()
+    hidraw_dirs = sorted(_class_entries("/sys/class/hidraw", "hidraw"))
+
+    # Probes and hidraw uevent reads are I/O bound (sysfs reads, or evdev opens with
+    # --deep), so issue them all at once; map() keeps results in input order.
+    probe = partial(_probe, deep=deep)
+    stopped_early = False
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        if quick:
+            # In order, so nothing past the preferred node is ever read
+            results = []
+            for i, sysfs_dir in enumerate(sysfs_dirs, 1):
+                result = probe(sysfs_dir)
+                if result:
+                    results.append(result)
+                    if result.is_gamepad:
+                        stopped_early = i < len(sysfs_dirs)
+                        break
+        else:
+            results = [r for r in pool.map(probe, sysfs_dirs) if r]
+        uevents = list(pool.map(_read_sysfs_bytes,
+                                [os.path.join(d, "device", "uevent") for d in hidraw_dirs]))
+
+    for result in results:
+        found.append((result.event_path, result.has_js))
+        if result.pid == SCUF_PRODUCT_ID_WIRED:
+            wired_count += 1
+        else:
+            wireless_count += 1
+        for line in result.lines:
+            print(line)
 
     # Print per-connection-type summary
+    missing = "not found before --quick stopped the scan" if stopped_early else "not found"
     print(f"Searching for wired controller (1b1c:{SCUF_PRODUCT_ID_WIRED:04x})... "
-          f"{'found ' + str(wired_count) + ' device(s)' if wired_count else 'not found'}")
+          f"{'found ' + str(wired_count) + ' device(s)' if wired_count else missing}")
     print(f"Searching for wireless receiver (1b1c:{SCUF_PRODUCT_ID_RECEIVER:04x})... "
-          f"{'found ' + str(wireless_count) + ' device(s)' if wireless_count else 'not found'}")
+          f"{'found ' + str(wireless_count) + ' device(s)' if wireless_count else missing}")
+    if stopped_early:
+        print(f"(--quick: stopped after {results[-1].event_path}; "
+              f"{len(sysfs_dirs) - i} later event node(s) not probed)")
     print()
 
     # Also show hidraw devices
     print("SCUF hidraw devices:")
-    for hidraw_dir in sorted(glob.glob("/sys/class/hidraw/hidraw*")):
-        uevent_path = os.path.join(hidraw_dir, "device", "uevent")
-        try:
-            uevent = open(uevent_path).read()
-        except (OSError, IOError):
+    for hidraw_dir, uevent in zip(hidraw_dirs, uevents):
+        m = _HID_ID_RE.search(uevent)
+        if not m:
             continue
-        for line in uevent.splitlines():
-            if line.startswith("HID_ID="):
-                parts = line.split("=", 1)[1].split(":")
-                if len(parts) >= 3:
-                    try:
-                        vid = int(parts[1], 16)
-                        pid = int(parts[2], 16)
-                    except ValueError:
-                        continue
-                    if vid == SCUF_VENDOR_ID and pid in (SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RECEIVER):
-                        pid_label = "wireless" if pid == SCUF_PRODUCT_ID_RECEIVER else "wired"
-                        dev_path = f"/dev/{os.path.basename(hidraw_dir)}"
-                        print(f"  {dev_path} ({pid_label})")
+        vid, pid = int(m[1], 16), int(m[2], 16)
+        if vid == SCUF_VENDOR_ID and pid in (SCUF_PRODUCT_ID_WIRED, SCUF_PRODUCT_ID_RECEIVER):
+            pid_label = "wireless" if pid == SCUF_PRODUCT_ID_RECEIVER else "wired"
+            dev_path = f"/dev/{os.path.basename(hidraw_dir)}"
+            print(f"  {dev_path} ({pid_label})")
     print()
 
     return found
 
 
 _STICK_AXIS_LABELS = {
-    ecodes.ABS_X:  "LEFT  X",
-    ecodes.ABS_Y:  "LEFT  Y",
-    ecodes.ABS_RX: "RIGHT X",
-    ecodes.ABS_RY: "RIGHT Y",
+    ecodes.ABS_X:  b"LEFT  X",
+    ecodes.ABS_Y:  b"LEFT  Y",
+    ecodes.ABS_RX: b"RIGHT X",
+    ecodes.ABS_RY: b"RIGHT Y",
 }
 _TRIGGER_AXIS_LABELS = {
-    ecodes.ABS_Z:  "L.TRIG",
-    ecodes.ABS_RZ: "R.TRIG",
+    ecodes.ABS_Z:  b"L.TRIG",
+    ecodes.ABS_RZ: b"R.TRIG",
 }
 
 
@@ -344,29 +502,34 @@ def run_deadzone_mode(profile_name=None):
     print(f"  {'AXIS':<10}  {'VALUE':>8}  {'NOTE'}")
     print("  " + "-" * 40)
 
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    reader = _EventReader(dev.fd)
     try:
-        for event in dev.read_loop():
-            if event.type == ecodes.EV_SYN:
-                continue
-            if event.type != ecodes.EV_ABS:
-                continue
-
-            code, val = event.code, event.value
-            if code in _STICK_AXIS_LABELS:
-                label = _STICK_AXIS_LABELS[code]
-                note = "(deadzone)" if val == 0 else ""
-                # Show anti-dz floor reminder when output is non-zero
-                anti = (p['left_stick_anti_deadzone'] if code in (ecodes.ABS_X, ecodes.ABS_Y)
-                        else p['right_stick_anti_deadzone'])
-                if val != 0 and anti and abs(val) < anti:
-                    note = f"(below anti-dz floor {anti})"
-                print(f"  {label:<10}  {val:>8}  {note}")
-            elif code in _TRIGGER_AXIS_LABELS:
-                label = _TRIGGER_AXIS_LABELS[code]
-                print(f"  {label:<10}  {val:>8}")
+        while True:
+            lines = bytearray()
+            for etype, code, val in reader.read():
+                if etype != ecodes.EV_ABS:
+                    continue
+
+                if code in _STICK_AXIS_LABELS:
+                    label = _STICK_AXIS_LABELS[code]
+                    note = b"(deadzone)" if val == 0 else b""
+                    # Show anti-dz floor reminder when output is non-zero
+                    anti = (p['left_stick_anti_deadzone'] if code in (ecodes.ABS_X, ecodes.ABS_Y)
+                            else p['right_stick_anti_deadzone'])
+                    if val != 0 and anti and abs(val) < anti:
+                        note = b"(below anti-dz floor %d)" % anti
+                    lines += b"  %-10s  %8d  %s\n" % (label, val, note)
+                elif code in _TRIGGER_AXIS_LABELS:
+                    lines += b"  %-10s  %8d\n" % (_TRIGGER_AXIS_LABELS[code], val)
+            if lines:
+                out.write(lines)
+                out.flush()
     except KeyboardInterrupt:
         print("\nDone.")
     finally:
+        reader.close()
         if not virtual:
             dev.close()
 
@@ -413,6 +576,26 @@ _HID_STICK_NAMES = {
 }
 
 
+_HID_REPORT_SIZE = 64
+_CMD_SOFTWARE_MODE = bytes([0x01, 0x03, 0x00, 0x02])
+_STICK_PACKET = struct.Struct("<hhhh")  # lx, ly, rx, ry at offset 1 of an analog report
+
+
+def _open_hid_interfaces(ctrl_path: str, analog_path: str | None) -> tuple[int, int | None]:
+    """Open the control (and analog, if known) hidraw nodes and enable software mode.
+
+    Software mode is required before the controller sends button reports.
+    """
+    ctrl_fd = os.open(ctrl_path, os.O_RDWR)
+    buf = bytearray(_HID_REPORT_SIZE)
+    buf[0] = 0x02
+    buf[1] = 0x08  # endpoint: wired; 0x09 for wireless — both work for reading
+    buf[2:2 + len(_CMD_SOFTWARE_MODE)] = _CMD_SOFTWARE_MODE
+    os.write(ctrl_fd, bytes(buf))
+    analog_fd = os.open(analog_path, os.O_RDONLY) if analog_path else None
+    return ctrl_fd, analog_fd
+
+
 def run_hidraw_mode(discovered, show_sticks: bool = False):
     """Read directly from HID raw interfaces and print all button/trigger/stick events.
 
@@ -438,19 +621,7 @@ def run_hidraw_mode(discovered, show_sticks: bool = False):
     print("=" * 60)
     print()
 
-    _REPORT_SIZE = 64
-    _CMD_SOFTWARE_MODE = bytes([0x01, 0x03, 0x00, 0x02])
-    endpoint = 0x08  # wired; 0x09 for wireless — both work for reading
-
-    ctrl_fd = os.open(ctrl_path, os.O_RDWR)
-    # Software mode required before the controller sends button reports
-    buf = bytearray(64)
-    buf[0] = 0x02
-    buf[1] = endpoint
-    buf[2:2 + len(_CMD_SOFTWARE_MODE)] = _CMD_SOFTWARE_MODE
-    os.write(ctrl_fd, bytes(buf))
-
-    analog_fd = os.open(analog_path, os.O_RDONLY) if analog_path else None
+    ctrl_fd, analog_fd = _open_hid_interfaces(ctrl_path, analog_path)
 
     fds = [ctrl_fd] + ([analog_fd] if analog_fd else [])
     prev_mask = 0
@@ -464,7 +635,7 @@ def run_hidraw_mode(discovered, show_sticks: bool = False):
             r, _, _ = select.select(fds, [], [], 0.5)
             for fd in r:
                 try:
-                    data = os.read(fd, _REPORT_SIZE)
+                    data = os.read(fd, _HID_REPORT_SIZE)
                 except OSError:
                     return
 
@@ -513,11 +684,7 @@ def run_hidraw_mode(discovered, show_sticks: bool = False):
 
                 # Analog stick packet (interface 3)
                 elif fd == analog_fd and len(data) >= 9:
-                    lx = int.from_bytes(data[1:3], 'little', signed=True)
-                    ly = int.from_bytes(data[3:5], 'little', signed=True)
-                    rx = int.from_bytes(data[5:7], 'little', signed=True)
-                    ry = int.from_bytes(data[7:9], 'little', signed=True)
-                    cur = [lx, ly, rx, ry]
+                    cur = lx, ly, rx, ry = _STICK_PACKET.unpack_from(data, 1)
                     if any(abs(cur[i] - prev_sticks[i]) >= _STICK_THRESHOLD for i in range(4)):
                         print(f"STICK:  L({lx:>7}, {ly:>7})  R({rx:>7}, {ry:>7})")
                         prev_sticks = cur
@@ -556,17 +723,7 @@ def run_bits_mode(discovered, show_sticks: bool = False):
     print("=" * 65)
     print()
 
-    _CMD_SOFTWARE_MODE = bytes([0x01, 0x03, 0x00, 0x02])
-    endpoint = 0x08
-
-    ctrl_fd = os.open(ctrl_path, os.O_RDWR)
-    buf = bytearray(64)
-    buf[0] = 0x02
-    buf[1] = endpoint
-    buf[2:2 + len(_CMD_SOFTWARE_MODE)] = _CMD_SOFTWARE_MODE
-    os.write(ctrl_fd, bytes(buf))
-
-    analog_fd = os.open(analog_path, os.O_RDONLY) if analog_path else None
+    ctrl_fd, analog_fd = _open_hid_interfaces(ctrl_path, analog_path)
     fds = [ctrl_fd] + ([analog_fd] if analog_fd else [])
 
     prev_mask = 0
@@ -579,7 +736,7 @@ def run_bits_mode(discovered, show_sticks: bool = False):
             r, _, _ = select.select(fds, [], [], 0.5)
             for fd in r:
                 try:
-                    data = os.read(fd, 64)
+                    data = os.read(fd, _HID_REPORT_SIZE)
                 except OSError:
                     return
 
@@ -616,11 +773,7 @@ def run_bits_mode(discovered, show_sticks: bool = False):
                             prev_triggers = (left, right)
 
                 elif fd == analog_fd and len(data) >= 9:
-                    lx = int.from_bytes(data[1:3], 'little', signed=True)
-                    ly = int.from_bytes(data[3:5], 'little', signed=True)
-                    rx = int.from_bytes(data[5:7], 'little', signed=True)
-                    ry = int.from_bytes(data[7:9], 'little', signed=True)
-                    cur = [lx, ly, rx, ry]
+                    cur = lx, ly, rx, ry = _STICK_PACKET.unpack_from(data, 1)
                     if any(abs(cur[i] - prev_sticks[i]) >= _STICK_THRESHOLD for i in range(4)):
                         print(f"  STICK    L({lx:>7}, {ly:>7})  R({rx:>7}, {ry:>7})")
                         prev_sticks = cur
@@ -652,6 +805,11 @@ def main():
                         help="Show analog stick values in HID raw / --bits mode (noisy)")
     parser.add_argument("--bits", action="store_true",
                         help="Bitmask discovery: press buttons one at a time to find their HID bit positions")
+    parser.add_argument("--deep", action="store_true",
+                        help="Open every SCUF evdev node during the device scan instead of reading sysfs")
+    parser.add_argument("--quick", action="store_true",
+                        help="Stop the device scan at the first gamepad joystick node "
+                             "(the one discovery prefers); later nodes are not listed")
     args = parser.parse_args()
 
     if args.deadzone:
@@ -671,8 +829,9 @@ def main():
     print("=" * 60)
     print()
 
-    # First: show ALL matching devices so the user can see what's detected
-    all_devices = scan_all_scuf_devices()
+    # First: show all matching devices (up to the preferred one with --quick) so the
+    # user can see what's detected
+    all_devices = scan_all_scuf_devices(deep=args.deep, quick=args.quick)
 
     # Then: run discovery to show what the driver would select
     print("-" * 60)
@@ -699,8 +858,10 @@ def main():
     print(f"Phys:        {dev.phys}")
     print()
 
-    # Print capabilities
-    caps = dev.capabilities(verbose=True)
+    # Print capabilities. Query the device once and resolve names locally: each
+    # capabilities() call re-issues EVIOCGBIT/EVIOCGABS for every event type.
+    raw_caps = dev.capabilities(verbose=False)
+    caps = dict(evdev.util.resolve_ecodes_dict(raw_caps))
     print("Capabilities:")
     for ev_type, codes in caps.items():
         if ev_type[0] == 0:  # Skip EV_SYN
@@ -715,13 +876,8 @@ def main():
     print()
 
     # Check if the selected device looks like a real gamepad
-    raw_caps = dev.capabilities(verbose=False)
-    has_abs_x = False
-    if ecodes.EV_ABS in raw_caps:
-        for entry in raw_caps[ecodes.EV_ABS]:
-            code = entry[0] if isinstance(entry, tuple) else entry
-            if code == ecodes.ABS_X:
-                has_abs_x = True
+    abs_codes = {e[0] if isinstance(e, tuple) else e for e in raw_caps.get(ecodes.EV_ABS, ())}
+    has_abs_x = ecodes.ABS_X in abs_codes
     has_buttons = ecodes.EV_KEY in raw_caps
 
     if not (has_abs_x and has_buttons):
@@ -770,12 +926,12 @@ def main():
     if virtual_dev:
         dev.close()
         dev = virtual_dev
-        button_names = VIRTUAL_BUTTON_NAMES
-        axis_names = VIRTUAL_AXIS_NAMES
+        button_labels = VIRTUAL_BUTTON_LABELS
+        axis_labels = VIRTUAL_AXIS_LABELS
         mode_label = "VIRTUAL (bridge output)"
     else:
-        button_names = SCUF_BUTTON_NAMES
-        axis_names = SCUF_AXIS_NAMES
+        button_labels = SCUF_BUTTON_LABELS
+        axis_labels = SCUF_AXIS_LABELS
         mode_label = "RAW evdev (paddles/SAX/G-keys NOT visible here)"
 
     print("=" * 60)
@@ -785,22 +941,45 @@ def main():
     print("=" * 60)
     print()
 
+    # Stick motion produces hundreds of lines a second: collect them and write to the
+    # binary stdout at most every 16 ms (or 4 KiB) instead of print() per event.
+    sys.stdout.flush()
+    out = _OutputThread()
+    pending = bytearray()
+    last_flush = time.monotonic()
+    reader = _EventReader(dev.fd)
     try:
-        for event in dev.read_loop():
-            if event.type == ecodes.EV_SYN:
-                continue
-            if event.type == ecodes.EV_KEY:
-                name = button_names.get(event.code, f"UNKNOWN (0x{event.code:03x})")
-                state = "PRESSED" if event.value == 1 else "RELEASED" if event.value == 0 else f"value={event.value}"
-                print(f"BUTTON: {name:45s} {state}")
-            elif event.type == ecodes.EV_ABS:
-                name = axis_names.get(event.code, f"UNKNOWN (0x{event.code:02x})")
-                print(f"AXIS:   {name:45s} value={event.value}")
-            else:
-                print(f"OTHER:  type={event.type} code={event.code} value={event.value}")
+        while True:
+            # Only wake on a short timer while there is output waiting to be flushed
+            for etype, code, value in reader.read(_FLUSH_INTERVAL if pending else _IDLE_TIMEOUT):
+                if etype == ecodes.EV_KEY:
+                    label = button_labels.get(code)
+                    if label is None:
+                        label = b"BUTTON: %-45s " % (b"UNKNOWN (0x%03x)" % code)
+                    pending += label
+                    pending += (BTN_PRESSED if value == 1 else BTN_RELEASED if value == 0
+                                else b"value=%d\n" % value)
+                elif etype == ecodes.EV_ABS:
+                    label = axis_labels.get(code)
+                    if label is None:
+                        label = b"AXIS:   %-45s " % (b"UNKNOWN (0x%02x)" % code)
+                    pending += label
+                    pending += b"value=%d\n" % value
+                else:
+                    pending += b"OTHER:  type=%d code=%d value=%d\n" % (etype, code, value)
+            now = time.monotonic()
+            if pending and (now - last_flush >= _FLUSH_INTERVAL or len(pending) >= 4096):
+                out.write(bytes(pending))
+                pending.clear()
+                last_flush = now
     except KeyboardInterrupt:
-        print("\nDone.")
+        pending += b"\nDone.\n"
     finally:
+        # Also on OSError (controller unplugged): the writer is a daemon thread, so
+        # anything still queued would be lost at exit
+        out.write(bytes(pending))
+        out.close()
+        reader.close()
         dev.close()
 
 